@@ -1,6 +1,10 @@
-from typing import Dict, Tuple
-from playwright.async_api import BrowserContext, Browser, Playwright, async_playwright, Page, Locator
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Tuple
+from playwright.async_api import BrowserContext, Browser, Playwright, async_playwright, Page, Locator, StorageState
+from pathlib import Path
 from uuid import uuid4, UUID
+from ..utils.browser_functions import VISIBILITY_TRACKER_SCRIPT
 
 class BrowserManager:
     """
@@ -154,7 +158,6 @@ class BrowserManager:
             KeyError: If no browser context is found with the given ID.
             RuntimeError: If the browser context is no longer valid.
         """
-        import asyncio
         print(f"[BrowserManager.create_page] Getting context {context_id}...")
         current_loop = asyncio.get_event_loop()
         print(f"[BrowserManager.create_page] Current event loop ID: {id(current_loop)}")
@@ -212,12 +215,17 @@ class BrowserManager:
             raise RuntimeError(f"Browser context for ID: {context_id} is no longer valid.")
         return browser_context
     
-    async def create_browser_context(self) -> Tuple[UUID, BrowserContext]:
+    async def create_browser_context(self, storage_state: StorageState | str | Path | None = None) -> Tuple[UUID, BrowserContext]:
         """
         Create a new browser context.
 
         Creates a new isolated browser context with its own cookies, cache, and storage.
-        Each agent session should have its own context.
+        Each agent session should have its own context. The context is seeded with an init
+        script that tracks which interactive elements are visible in the viewport.
+
+        Args:
+            storage_state: Optional cookies and local storage to start the context with, either
+                as returned by BrowserContext.storage_state() or a path to a file saved by it.
 
         Returns:
             Tuple[UUID, BrowserContext]: A tuple containing the new context's UUID and the
@@ -227,7 +235,8 @@ class BrowserManager:
             RuntimeError: If the browser instance is not initialized.
         """
         context_id = uuid4()
-        browser_context = await self.browser.new_context()
+        browser_context = await self.browser.new_context(storage_state=storage_state)
+        await browser_context.add_init_script(script=VISIBILITY_TRACKER_SCRIPT)
         print("Created")
         self._contexts[context_id] = browser_context
         return (context_id, browser_context)
@@ -244,19 +253,66 @@ class BrowserManager:
 
         Note:
             If the context doesn't exist, this method silently succeeds without error.
-            All pages within the context are automatically removed from tracking.
+            All pages within the context and their locators are automatically removed from tracking.
         """
         browser_context = self._contexts.get(context_id, None)
         if browser_context:
             await browser_context.close()
             del self._contexts[context_id]
-            if context_id in self._pages:
-                del self._pages[context_id]
+            for page_id in self._pages.pop(context_id, {}):
+                self._locators.pop(page_id, None)
+                
+    @asynccontextmanager
+    async def managed_context(self, storage_state: StorageState | str | Path | None = None) -> AsyncIterator[Tuple[UUID, BrowserContext]]:
+        """
+        Create a browser context that is deleted when the block exits.
+
+        Deleting the context closes all of its pages with it, including when the block
+        raises, so no page or context outlives the block.
+
+        Args:
+            storage_state: Optional cookies and local storage to start the context with,
+                as accepted by create_browser_context().
+
+        Yields:
+            Tuple[UUID, BrowserContext]: The new context's UUID and the BrowserContext instance.
+
+        Raises:
+            RuntimeError: If the browser instance is not initialized.
+        """
+        context_id, browser_context = await self.create_browser_context(storage_state=storage_state)
+        try:
+            yield context_id, browser_context
+        finally:
+            await self.delete_browser_context_by_id(context_id)
                 
-    async def get_locator_by_id(self, page_id: UUID, locator_id: UUID) -> Locator:
+    async def reset_browser_context(self, context_id: UUID):
+        """
+        Return a browser context to a clean state without closing it.
+
+        Closes every page in the context, drops their tracked pages and locators and
+        clears the context's cookies. Cheaper than deleting and recreating the context.
+
+        Args:
+            context_id: The UUID of the browser context to reset.
+
+        Raises:
+            KeyError: If no browser context is found with the given ID.
+            RuntimeError: If the browser context is no longer valid.
+        """
+        browser_context = self.get_browser_context_by_id(context_id)
+        for page_id in self._pages.pop(context_id, {}):
+            self._locators.pop(page_id, None)
+        await asyncio.gather(*(page.close() for page in browser_context.pages))
+        await browser_context.clear_cookies()
+                
+    def get_locator_by_id(self, page_id: UUID, locator_id: UUID) -> Locator:
         """
         Retrieve a locator by its ID within a specific page.
 
+        The locator is not resolved against the page here. Actions on it auto-wait for
+        the element and fail with a timeout if it no longer matches.
+
         Args:
             page_id: The UUID of the page containing the locator.
             locator_id: The UUID of the locator to retrieve.
@@ -266,33 +322,26 @@ class BrowserManager:
 
         Raises:
             KeyError: If no locator is found with the given IDs.
-            RuntimeError: If the locator exists but is no longer valid.
         """
         page_locators = self._locators.get(page_id, {})
         locator = page_locators.get(locator_id, None)
         if locator is None:
             raise KeyError(f"No locator found for ID: {locator_id} in page ID: {page_id}")
-        try:
-            _ = await locator.element_handle()
-        except Exception:
-            raise RuntimeError(f"Locator with ID: {locator_id} in page ID: {page_id} is no longer valid.")
         return locator
     
-    async def store_locator(self, page_id: UUID, locator: Locator) -> UUID:
+    def store_locators(self, page_id: UUID, locators: List[Locator]) -> List[UUID]:
         """
-        Store a locator and assign it a UUID.
+        Store a batch of locators for a page in a single update.
 
         Args:
-            page_id: The UUID of the page where the locator is found.
-            locator: The Playwright Locator instance to store.
+            page_id: The UUID of the page where the locators are found.
+            locators: The Playwright Locator instances to store.
         Returns:
-            UUID: The assigned UUID for the stored locator.
-        """        
-        locator_id = uuid4()
-        if page_id not in self._locators:
-            self._locators[page_id] = {}
-        self._locators[page_id][locator_id] = locator
-        return locator_id
+            List[UUID]: The assigned UUIDs, in the same order as the locators.
+        """
+        new_locators = {uuid4(): locator for locator in locators}
+        self._locators.setdefault(page_id, {}).update(new_locators)
+        return list(new_locators)
     
     def delete_locator_by_id(self, page_id: UUID, locator_id: UUID):
         """
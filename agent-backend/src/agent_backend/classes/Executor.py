@@ -5,6 +5,7 @@ from ..types.llm import ParsedFunction
 from ..types.tool import ToolResponse
 from ..tools.playwright_functions import playwright_function_names_to_tools, playwright_function_names_to_functions
 from collections.abc import Callable
+from inspect import iscoroutinefunction
 
 class Executor:
     def __init__(self, env_key: str):
@@ -80,7 +81,11 @@ class Executor:
     async def _execute_function(self, parsed_function: ParsedFunction, context_id: UUID)->ToolResponse:
         function = parsed_function.function
         try:
-            res = await function(**parsed_function.arguments, context_id=context_id)
+            # Only pay for a coroutine and an event loop hop when the tool actually awaits
+            if iscoroutinefunction(function):
+                res = await function(**parsed_function.arguments, context_id=context_id)
+            else:
+                res = function(**parsed_function.arguments, context_id=context_id)
         except Exception as e:
             return ToolResponse(
                 success=False,
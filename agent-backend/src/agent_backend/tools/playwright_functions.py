@@ -3,24 +3,77 @@ from uuid import UUID
 from typing import Any
 from ..types.tool import Tool, Parameters, ToolResponse
 from ..utils.browser_functions import get_browser_context_by_id, get_page_by_id, create_page, create_new_locators_for_page, get_locator_by_id, get_labeled_elements, detect_url_change
-from typing import Dict, List, Callable, Awaitable
-import time
+from typing import Dict, List, Callable, Awaitable, Tuple, Mapping, Literal
+from types import MappingProxyType
+import asyncio
 
+# Cap on concurrent is_visible() round trips issued for a single query
+_VISIBILITY_CHECK_CONCURRENCY = 64
 
-async def go_to_url(context_id: UUID, url: str) -> ToolResponse:
-    """Navigate to a page using the global browser instance.
+
+async def _filter_visible(locators: List[Locator]) -> List[Locator]:
+    """Filter locators down to the visible ones, checking visibility concurrently."""
+    if not locators:
+        return []
+    semaphore = asyncio.Semaphore(_VISIBILITY_CHECK_CONCURRENCY)
+
+    async def is_visible(locator: Locator) -> bool:
+        async with semaphore:
+            return await locator.is_visible()
+
+    visibility = await asyncio.gather(*(is_visible(locator) for locator in locators))
+    return [locator for locator, visible in zip(locators, visibility) if visible]
+
+# Locator builders for each supported query_by value
+_QUERY_BY_HANDLERS: Dict[str, Callable[[Page, str], Locator]] = {
+    "css": lambda page, query: page.locator(query),
+    "label": lambda page, query: page.get_by_label(query),
+    "text": lambda page, query: page.get_by_text(query),
+}
+_VALID_QUERY_BYS: frozenset[str] = frozenset(_QUERY_BY_HANDLERS)
+
+# Given the elements a locator matches, returns the indices of the visible ones so they can be
+# picked out with Locator.nth(). Visibility approximates Locator.is_visible(): a non-empty box and
+# not visibility:hidden, without Playwright's handling of display:contents children.
+_VISIBLE_INDICES_JS = """elements => elements.flatMap((el, i) => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden' ? [i] : [];
+})"""
+
+# Navigation events page.goto can wait for, earliest first
+WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
+async def open_page(context_id: UUID, url: str, wait_until: WaitUntil = "load") -> Tuple[UUID | None, ToolResponse]:
+    """Open a new page in a browser context and navigate it to a URL.
     Args:
         context_id: The UUID of the browser context where the page will be created.
         url: The URL to navigate to.
+        wait_until: When navigation counts as finished. The default waits for the load event so
+            scripts have rendered the page before it is scraped; pass "domcontentloaded" when only
+            the DOM matters.
     Returns:
-        ToolResponse: A dict with success status and page_id or error message."""
+        Tuple[UUID | None, ToolResponse]: The new page's UUID (None if it could not be created)
+            and the navigation result.
+    """
+    page_id = None
     try:
         page_id, page = await create_page(context_id)
-        await page.goto(url, timeout=30000)  # 30 second timeout
+        await page.goto(url, timeout=30000, wait_until=wait_until)  # 30 second timeout
         labeled_elements = await get_labeled_elements(context_id, page_id)
-        return ToolResponse(success=True, content=f"Successfully navigated to '{url}'. Page ID: {str(page_id)}. Reactive Elements on the page: {labeled_elements}" )
+        return page_id, ToolResponse(success=True, content=f"Successfully navigated to '{url}'. Page ID: {str(page_id)}. Reactive Elements on the page: {labeled_elements}" )
     except Exception as e:
-        return ToolResponse(success=False, content=f"ERROR: Failed to navigate to '{url}': {str(e)}")
+        return page_id, ToolResponse(success=False, content=f"ERROR: Failed to navigate to '{url}': {str(e)}")
+
+async def go_to_url(context_id: UUID, url: str, wait_until: WaitUntil = "load") -> ToolResponse:
+    """Navigate to a page using the global browser instance.
+    Args:
+        context_id: The UUID of the browser context where the page will be created.
+        url: The URL to navigate to.
+        wait_until: When navigation counts as finished, as for open_page.
+    Returns:
+        ToolResponse: A dict with success status and page_id or error message."""
+    _, response = await open_page(context_id, url, wait_until=wait_until)
+    return response
 
 go_to_url_tool = Tool(
     type="function",
@@ -47,7 +100,7 @@ go_to_url_tool = Tool(
 #         ToolResponse: A dict with success status and message.
 #     """
 #     try:
-#         page: Page = await get_page_by_id(context_id, page_id)
+#         page: Page = get_page_by_id(context_id, page_id)
 
 #         # get current URL to detect page change
 #         current_url = page.url
@@ -87,7 +140,7 @@ go_to_url_tool = Tool(
 #         ToolResponse: A dict with success status and message.
 #     """
 #     try:
-#         page: Page = await get_page_by_id(context_id, page_id)
+#         page: Page = get_page_by_id(context_id, page_id)
 #         # check if URL has changed, if so, return new elements
 #         await page.fill(selector=selector, value=text, timeout=5000)
 #         return ToolResponse(success=True, content=f"Successfully typed text '{text}' into element with selector '{selector}'.")
@@ -122,7 +175,7 @@ go_to_url_tool = Tool(
 #         ToolResponse: A dict with success status and extracted text or error message.
 #     """
 #     try:
-#         page: Page = await get_page_by_id(context_id, page_id)
+#         page: Page = get_page_by_id(context_id, page_id)
 #         text_content = await page.text_content(selector=selector, timeout=5000)
 #         if text_content is None:
 #             return ToolResponse(success=False, content=f"ERROR: No text content found in element with selector '{selector}'.")
@@ -158,7 +211,7 @@ go_to_url_tool = Tool(
 #         ToolResponse: A dict with success status and message.
 #     """
 #     try:
-#         page: Page = await get_page_by_id(context_id, page_id)
+#         page: Page = get_page_by_id(context_id, page_id)
 #         await page.wait_for_selector(selector=selector, timeout=timeout)
 #         return ToolResponse(success=True, content=f"Element with selector '{selector}' is now present on the page.")
 #     except TimeoutError:
@@ -192,7 +245,7 @@ async def wait_for(context_id: UUID, page_id: UUID, timeout: int = 5000) -> Tool
     Returns:
         ToolResponse: A dict with success status and message.
     """
-    time.sleep(timeout / 1000)
+    await asyncio.sleep(timeout / 1000)
     return ToolResponse(success=True, content=f"Waited for {timeout} milliseconds.")
 
 wait_for_tool = Tool(
@@ -248,7 +301,7 @@ async def evaluate_script(context_id: UUID, page_id: UUID, script: str, arg: Any
         ToolResponse: A dict with success status and script result or error message.
     """
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
+        page: Page = get_page_by_id(context_id, page_id)
         
         # get current URL to detect page change
         current_url = page.url
@@ -287,7 +340,7 @@ async def scroll(context_id: UUID, page_id: UUID, x: int, y: int) -> ToolRespons
         ToolResponse: A dict with success status and message.
     """
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
+        page: Page = get_page_by_id(context_id, page_id)
         await page.evaluate(f"window.scrollTo({x}, {y});")
         return ToolResponse(success=True, content=f"Successfully scrolled to position ({x}, {y}).")
     except Exception as e:
@@ -320,7 +373,7 @@ async def set_viewport_size(context_id: UUID, page_id: UUID, width: int, height:
         ToolResponse: A dict with success status and message.
     """
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
+        page: Page = get_page_by_id(context_id, page_id)
         await page.set_viewport_size({"width": width, "height": height})
         return ToolResponse(success=True, content=f"Successfully set viewport size to ({width}, {height}).")
     except Exception as e:
@@ -351,7 +404,7 @@ async def reload_page(context_id: UUID, page_id: UUID) -> ToolResponse:
         ToolResponse: A dict with success status and message.
     """
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
+        page: Page = get_page_by_id(context_id, page_id)
         await page.reload()
         
         labeled_elements = await get_labeled_elements(context_id, page_id)
@@ -373,17 +426,19 @@ reload_page_tool = Tool(
     strict=True
 )
 
-async def screenshot_page(context_id: UUID, page_id: UUID, path: str) -> ToolResponse:
+async def screenshot_page(context_id: UUID, page_id: UUID, path: str, quality: int | None = None) -> ToolResponse:
     """Take a screenshot of a page.
     Args:
         context_id: The UUID of the browser context containing the page.
         page_id: The UUID of the page to screenshot.
+        path: The file path to save to. The image format follows the extension (.png or .jpg).
+        quality: JPEG quality between 0 and 100. Only applies to .jpg paths.
     Returns:
         ToolResponse: A dict with success status and message.
     """
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
-        await page.screenshot(path=path)
+        page: Page = get_page_by_id(context_id, page_id)
+        await page.screenshot(path=path, quality=quality)
         return ToolResponse(success=True, content=f"Successfully took screenshot and saved to '{path}'.")
     except Exception as e:
         return ToolResponse(success=False, content=f"ERROR: Unexpected error taking screenshot: {str(e)}")
@@ -396,7 +451,8 @@ screenshot_page_tool = Tool(
         type="object",
         properties={
             "page_id": {"type": "UUID", "description": "The UUID of the page to screenshot."},
-            "path": {"type": "string", "description": "The file path where the screenshot will be saved."}
+            "path": {"type": "string", "description": "The file path where the screenshot will be saved. Use a .jpg extension for a smaller, faster JPEG."},
+            "quality": {"type": "integer", "description": "JPEG quality between 0 and 100. Only applies to .jpg paths."}
         },
         required=["page_id", "path"]
     ),
@@ -406,7 +462,7 @@ screenshot_page_tool = Tool(
 # async def get_open_pages(context_id: UUID) -> ToolResponse:
 #     """Retrieve all open pages in a given browser context."""
 #     try:
-#         browser_context = await get_browser_context_by_id(context_id)
+#         browser_context = get_browser_context_by_id(context_id)
 #         pages = browser_context.pages
 #         page_info = [f"Page {i}: {page.url}" for i, page in enumerate(pages)]
 #         return ToolResponse(success=True, content="\n".join(page_info) if page_info else "No open pages.")
@@ -436,26 +492,18 @@ async def get_locator_uuids_by(context_id: UUID, page_id: UUID, query: str, quer
         ToolResponse: A dict with success status and message about element found or error.
     """
     # Validate query_by parameter
-    valid_query_types = ["css", "label", "text"]
-    if query_by not in valid_query_types:
+    if query_by not in _VALID_QUERY_BYS:
         return ToolResponse(
             success=False,
-            content=f"ERROR: Invalid query_by value '{query_by}'. Must be one of {valid_query_types}."
+            content=f"ERROR: Invalid query_by value '{query_by}'. Must be one of {list(_QUERY_BY_HANDLERS)}."
         )
 
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
-
-        # Use appropriate locator method based on query_by
-        if query_by == "css":
-            locator = page.locator(query)
-        elif query_by == "label":
-            locator = page.get_by_label(query)
-        else:
-            locator = page.get_by_text(query)
+        page: Page = get_page_by_id(context_id, page_id)
+        locator = _QUERY_BY_HANDLERS[query_by](page, query)
 
         # Filter by visible elements
-        visible_locators = [locator for locator in await locator.all() if await locator.is_visible()]
+        visible_locators = await _filter_visible(await locator.all())
 
         # Check if element exists and is visible
         count = len(visible_locators)
@@ -468,9 +516,10 @@ async def get_locator_uuids_by(context_id: UUID, page_id: UUID, query: str, quer
         # Create locators in BrowserManager
         new_ids = await create_new_locators_for_page(page_id, visible_locators)
 
+        locator_ids = ", ".join(locator_id.hex for locator_id in new_ids)
         return ToolResponse(
             success=True,
-            content=f"Found {count} element(s) with {query_by}='{query}'. Locator IDs: {new_ids}"
+            content=f"Found {count} element(s) with {query_by}='{query}'. Locator IDs: [{locator_ids}]"
         )
     except TimeoutError:
         return ToolResponse(
@@ -499,6 +548,76 @@ get_locator_uuids_by_tool = Tool(
     strict=True
 )
 
+async def get_locator_uuids_by_many(context_id: UUID, page_id: UUID, selectors: str) -> ToolResponse:
+    """Get locator UUIDs for the visible elements matching several CSS selectors at once.
+    This is not a single batched query: each selector still costs one evaluate_all round
+    trip, but the round trips run concurrently.
+    Args:
+        context_id: The UUID of the browser context containing the page.
+        page_id: The UUID of the page to query.
+        selectors: CSS selectors separated by semicolons, e.g. "#login;input[name=q]".
+    Returns:
+        ToolResponse: A dict with success status and the locator IDs found for each selector.
+    """
+    queries = [selector.strip() for selector in selectors.split(";") if selector.strip()]
+    if not queries:
+        return ToolResponse(success=False, content="ERROR: No selectors provided.")
+
+    try:
+        page: Page = get_page_by_id(context_id, page_id)
+
+        # Match with Playwright's own selector engine, as page.locator() does, so the indices
+        # line up with nth() even for shadow DOM matches and Playwright-only pseudo-classes.
+        # The selectors are resolved concurrently, one evaluate_all round trip each.
+        bases = [page.locator(query) for query in queries]
+        results = await asyncio.gather(
+            *(base.evaluate_all(_VISIBLE_INDICES_JS) for base in bases),
+            return_exceptions=True
+        )
+
+        locators: List[Locator] = []
+        for base, indices in zip(bases, results):
+            if isinstance(indices, list):
+                locators.extend(base.nth(i) for i in indices)
+
+        # Store every match in a single batch, then hand the IDs back out per selector
+        new_ids = iter(await create_new_locators_for_page(page_id, locators) if locators else [])
+        lines = []
+        for query, indices in zip(queries, results):
+            if isinstance(indices, BaseException):
+                lines.append(f"ERROR: Could not resolve css='{query}': {str(indices)}")
+            elif not indices:
+                lines.append(f"ERROR: No element found with css='{query}'.")
+            else:
+                locator_ids = ", ".join(next(new_ids).hex for _ in indices)
+                lines.append(f"Found {len(indices)} element(s) with css='{query}'. Locator IDs: [{locator_ids}]")
+        return ToolResponse(success=bool(locators), content="\n".join(lines))
+    except TimeoutError:
+        return ToolResponse(
+            success=False,
+            content=f"ERROR: Request timed out while searching for elements with selectors '{selectors}'."
+        )
+    except Exception as e:
+        return ToolResponse(
+            success=False,
+            content=f"ERROR: Unexpected error while searching for elements with selectors '{selectors}': {str(e)}"
+        )
+
+get_locator_uuids_by_many_tool = Tool(
+    type="function",
+    name="get_locator_uuids_by_many",
+    description="Get UUIDs for visible element locators matching several CSS selectors in one call. Selectors must not contain commas.",
+    parameters=Parameters(
+        type="object",
+        properties={
+            "page_id": {"type": "UUID", "description": "The UUID of the page to query."},
+            "selectors": {"type": "string", "description": "CSS selectors separated by semicolons, e.g. '#login;input[name=q]'."}
+        },
+        required=["page_id", "selectors"]
+    ),
+    strict=True
+)
+
 # NEED CONTEXT ID FOR GENERALIZED FUNCTION CALLING IN EXECUTOR
 async def click_by_locator(context_id, page_id: UUID, locator_uuid: UUID) -> ToolResponse:
     """Click an element on a page using a stored locator UUID.
@@ -509,11 +628,11 @@ async def click_by_locator(context_id, page_id: UUID, locator_uuid: UUID) -> Too
         ToolResponse: A dict with success status and message.
     """
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
+        page: Page = get_page_by_id(context_id, page_id)
 
         # get current URL to detect page change
         current_url = page.url
-        locator: Locator = await get_locator_by_id(page_id, locator_uuid)
+        locator: Locator = get_locator_by_id(page_id, locator_uuid)
         await locator.click(timeout=5000)
 
         # check if URL has changed, if so, return new elements
@@ -552,7 +671,7 @@ async def fill_field_by_locator(context_id, page_id: UUID, locator_uuid: UUID, t
         ToolResponse: A dict with success status and message.
     """
     try:
-        locator: Locator = await get_locator_by_id(page_id, locator_uuid)
+        locator: Locator = get_locator_by_id(page_id, locator_uuid)
         await locator.fill(value=text, timeout=5000)
         return ToolResponse(success=True, content=f"Successfully filled text '{text}' into element with locator UUID '{locator_uuid}'.")
     except TimeoutError:
@@ -587,7 +706,7 @@ async def extract_text_by_locator(context_id, page_id: UUID, locator_uuid: UUID)
         ToolResponse: A dict with success status and extracted text or error message.
     """
     try:
-        locator: Locator = await get_locator_by_id(page_id, locator_uuid)
+        locator: Locator = get_locator_by_id(page_id, locator_uuid)
         text_content = await locator.text_content(timeout=5000)
         if text_content is None:
             return ToolResponse(success=False, content=f"ERROR: No text content found in element with locator UUID '{locator_uuid}'.")
@@ -624,7 +743,7 @@ async def wait_for_locator(context_id, page_id: UUID, locator_uuid: UUID, timeou
         ToolResponse: A dict with success status and message.
     """
     try:
-        locator: Locator = await get_locator_by_id(page_id, locator_uuid)
+        locator: Locator = get_locator_by_id(page_id, locator_uuid)
         await locator.wait_for(state="visible", timeout=timeout)
         return ToolResponse(success=True, content=f"Element with locator UUID '{locator_uuid}' is now visible on the page.")
     except TimeoutError:
@@ -660,11 +779,11 @@ async def press_key_by_locator(context_id, page_id: UUID, locator_uuid: UUID, ke
         ToolResponse: A dict with success status and message.
     """
     try:
-        page: Page = await get_page_by_id(context_id, page_id)
+        page: Page = get_page_by_id(context_id, page_id)
 
         # get current URL to detect page change
         current_url = page.url
-        locator: Locator = await get_locator_by_id(page_id, locator_uuid)
+        locator: Locator = get_locator_by_id(page_id, locator_uuid)
         await locator.press(key=key, timeout=5000)
 
         # check if URL has changed, if so, return new elements
@@ -702,7 +821,7 @@ press_key_by_locator_tool = Tool(
 #         ToolResponse: A dict with success status and message.
 #     """
 #     try:
-#         page: Page = await get_page_by_id(context_id, page_id)
+#         page: Page = get_page_by_id(context_id, page_id)
 
 #         # get current URL to detect page change
 #         current_url = page.url
@@ -732,7 +851,8 @@ press_key_by_locator_tool = Tool(
 # )
 
 
-playwright_function_names_to_functions: Dict[str, Callable[..., Awaitable[ToolResponse]]] = {
+# Tool registries are finalized at import and exposed read-only
+playwright_function_names_to_functions: Mapping[str, Callable[..., Awaitable[ToolResponse]]] = MappingProxyType({
     "go_to_url": go_to_url,
     # "click": click,
     # "type_text": type_text,
@@ -748,13 +868,14 @@ playwright_function_names_to_functions: Dict[str, Callable[..., Awaitable[ToolRe
     "get_elements_selectors_on_page": get_elements_selectors_on_page,
     # "get_open_pages": get_open_pages,
     "get_locator_uuids_by": get_locator_uuids_by,
+    "get_locator_uuids_by_many": get_locator_uuids_by_many,
     "click_by_locator": click_by_locator,
     "fill_field_by_locator": fill_field_by_locator,
     "extract_text_by_locator": extract_text_by_locator,
     "wait_for_locator": wait_for_locator,
     "press_key_by_locator": press_key_by_locator
-}
-playwright_function_names_to_tools: Dict[str, Tool] = {
+})
+playwright_function_names_to_tools: Mapping[str, Tool] = MappingProxyType({
     "go_to_url": go_to_url_tool,
     # "click": click_tool,
     # "type_text": type_text_tool,
@@ -770,11 +891,14 @@ playwright_function_names_to_tools: Dict[str, Tool] = {
     "get_elements_selectors_on_page": get_elements_selectors_on_page_tool,
     # "get_open_pages": get_open_pages_tool,
     "get_locator_uuids_by": get_locator_uuids_by_tool,
+    "get_locator_uuids_by_many": get_locator_uuids_by_many_tool,
     "click_by_locator": click_by_locator_tool,
     "fill_field_by_locator": fill_field_by_locator_tool,
     "extract_text_by_locator": extract_text_by_locator_tool,
     "wait_for_locator": wait_for_locator_tool,
     "press_key_by_locator": press_key_by_locator_tool
-}
+})
+
+PLAYWRIGHT_FUNCTION_NAMES: frozenset[str] = frozenset(playwright_function_names_to_functions)
 
 all_playwright_tools: List[Tool] = list(playwright_function_names_to_tools.values())
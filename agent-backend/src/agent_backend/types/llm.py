@@ -5,7 +5,7 @@ from ..types.tool import ToolResponse
 
 @dataclass
 class ParsedFunction:
-    function: Callable[..., Awaitable[ToolResponse]]
+    function: Callable[..., Awaitable[ToolResponse] | ToolResponse]
     arguments: Dict[str, Any]
 
 @dataclass
@@ -16,7 +16,7 @@ class Tool:
     parameters: Parameters
     strict: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class ToolResponse:
     success: bool
     content: str
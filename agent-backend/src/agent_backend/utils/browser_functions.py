@@ -1,7 +1,9 @@
-from playwright.async_api import Page, BrowserContext, Locator
+from playwright.async_api import Page, BrowserContext, Locator, StorageState
+from pathlib import Path
 from uuid import UUID
+from contextlib import AbstractAsyncContextManager
 from typing import Tuple, TYPE_CHECKING, List
-from asyncio import gather
+import re
 
 if TYPE_CHECKING:
     from ..classes.BrowserManager import BrowserManager
@@ -10,6 +12,94 @@ if TYPE_CHECKING:
 _browser_manager: "BrowserManager | None" = None
 
 
+def _minify_js(source: str) -> str:
+    """Strip whole-line comments and collapse whitespace in an inline script.
+
+    Only handles `//` comments on their own line, which is all the scripts in this module use.
+    """
+    source = re.sub(r"^\s*//.*$", "", source, flags=re.MULTILINE)
+    return re.sub(r"\s+", " ", source).strip()
+
+
+# Init script installed on every browser context. Tracks which interactive elements are
+# currently in the viewport with an IntersectionObserver, so scraping the page does not
+# need a getBoundingClientRect (and potential layout flush) per element. The observer only
+# reports after the next frame, so elements it has not reported on yet are absent from the map.
+VISIBILITY_TRACKER_SCRIPT = _minify_js("""(() => {
+    if (window.__interactiveVisibility) return;
+    const selector = 'a, button, input, select, textarea, [role="button"]';
+    const visibility = new WeakMap();
+    const io = new IntersectionObserver(entries => {
+        for (const entry of entries) {
+            const rect = entry.boundingClientRect;
+            visibility.set(entry.target, entry.isIntersecting && rect.width > 0 && rect.height > 0);
+        }
+    });
+    const observeTree = node => {
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+        if (node.matches(selector)) io.observe(node);
+        node.querySelectorAll(selector).forEach(el => io.observe(el));
+    };
+    new MutationObserver(records => {
+        for (const record of records) {
+            // An element can become interactive later by gaining role="button"
+            if (record.type === 'attributes') observeTree(record.target);
+            else record.addedNodes.forEach(observeTree);
+        }
+    }).observe(document, { childList: true, subtree: true, attributes: true, attributeFilter: ['role'] });
+    window.__interactiveVisibility = visibility;
+})();""")
+
+# Scrapes the interactive elements currently in the viewport. Minified once at import so
+# every get_labeled_elements call sends the compact form to the page.
+_LABEL_JS = _minify_js("""() => {
+    const interactive = [];
+    const viewportWidth = window.innerWidth;
+    const viewportHeight = window.innerHeight;
+    const visibility = window.__interactiveVisibility;
+
+    document.querySelectorAll('a, button, input, select, textarea, [role="button"]').forEach(el => {
+        // If not visible, skip. Trust the tracker for elements it has reported on and
+        // measure the rest, e.g. ones added since the last frame, against the same viewport
+        // bounds the tracker uses.
+        const tracked = visibility && visibility.get(el);
+        if (tracked === false) return;
+        if (tracked === undefined) {
+            const rect = el.getBoundingClientRect();
+            if (rect.width === 0 || rect.height === 0) return;
+            if (rect.bottom < 0 || rect.top > viewportHeight) return;
+            if (rect.right < 0 || rect.left > viewportWidth) return;
+        }
+
+        const tag = el.tagName.toLowerCase();
+        // textContent reads the raw DOM text, innerText would force a layout to compute it.
+        // It keeps the markup's whitespace, so collapse it before spending the 60-character budget
+        const text = ((el.textContent || '').replace(/\\s+/g, ' ').trim() || el.value || el.placeholder || '').slice(0, 60);
+        const id = el.id;
+        // Index classList directly rather than allocating an array per element
+        const cl = el.classList;
+        const classes = cl.length ? (cl.length > 1 ? cl[0] + '.' + cl[1] : cl[0]) : '';
+        
+        // Build selector
+        let selector = tag;
+        if (id) selector = `#${id}`;
+        else if (classes) selector += `.${classes}`;
+        
+        interactive.push({
+            selector: selector,
+            tag: tag,
+            text: text,
+            type: el.type,
+            aria: el.getAttribute('aria-label'),
+            id: id,
+            classes: classes
+        });
+    });
+    
+    return interactive;
+}""")
+
+
 def init_browser_functions(browser_manager: "BrowserManager") -> None:
     """Initialize the browser functions module with a BrowserManager instance."""
     global _browser_manager
@@ -23,19 +113,27 @@ def _get_browser_manager() -> "BrowserManager":
     return _browser_manager
 
 
-async def get_browser_context_by_id(context_id: UUID) -> BrowserContext:
+def get_browser_context_by_id(context_id: UUID) -> BrowserContext:
     """Retrieve a browser context by its ID."""
     return _get_browser_manager().get_browser_context_by_id(context_id)
 
-async def create_browser_context() -> Tuple[UUID, BrowserContext]:
-    """Create a new browser context using the global browser instance."""
-    return await _get_browser_manager().create_browser_context()
+async def create_browser_context(storage_state: StorageState | str | Path | None = None) -> Tuple[UUID, BrowserContext]:
+    """Create a new browser context using the global browser instance, optionally seeded with a saved storage state."""
+    return await _get_browser_manager().create_browser_context(storage_state=storage_state)
 
 async def delete_browser_context_by_id(context_id: UUID):
     """Delete a browser context by its ID."""
     await _get_browser_manager().delete_browser_context_by_id(context_id)
+
+def managed_context(storage_state: StorageState | str | Path | None = None) -> AbstractAsyncContextManager[Tuple[UUID, BrowserContext]]:
+    """Create a browser context for an `async with` block, deleting it and its pages when the block exits."""
+    return _get_browser_manager().managed_context(storage_state=storage_state)
+
+async def reset_browser_context(context_id: UUID):
+    """Close all pages and clear cookies in a browser context, keeping it open for reuse."""
+    await _get_browser_manager().reset_browser_context(context_id)
     
-async def get_page_by_id(context_id: UUID, page_id: UUID)->Page:
+def get_page_by_id(context_id: UUID, page_id: UUID)->Page:
     """Retrieve a page by its ID within a specific browser context."""
     return _get_browser_manager().get_page_by_id(context_id, page_id)
 
@@ -52,52 +150,18 @@ async def delete_page_by_page_id(context_id: UUID, page_id: UUID):
     
 async def create_new_locators_for_page(page_id: UUID, locators: List[Locator]):
     """Create a new locators dictionary for a specific page."""
-    browser_manager = _get_browser_manager()
-    returned_ids = await gather(*(browser_manager.store_locator(page_id, locator) for locator in locators))
+    returned_ids = _get_browser_manager().store_locators(page_id, locators)
     print(returned_ids)
     return returned_ids
 
-async def get_locator_by_id(page_id: UUID, locator_id: UUID) -> Locator:
+def get_locator_by_id(page_id: UUID, locator_id: UUID) -> Locator:
     """Retrieve a locator by its ID within a specific page."""
-    return await _get_browser_manager().get_locator_by_id(page_id, locator_id)
+    return _get_browser_manager().get_locator_by_id(page_id, locator_id)
 
 async def get_labeled_elements(context_id: UUID, page_id: UUID):
     # execute script to scrape all interractive elements on a page and then format them into a list
     page: Page = _get_browser_manager().get_page_by_id(context_id=context_id, page_id=page_id)
-    elements = await page.evaluate("""() => {
-        const interactive = [];
-        const viewportHeight = window.innerHeight;
-        
-        document.querySelectorAll('a, button, input, select, textarea, [role="button"]').forEach(el => {
-            const rect = el.getBoundingClientRect();
-            
-            // If not visible, skip
-            if (rect.width === 0 || rect.height === 0) return;
-            if (rect.bottom < 0 || rect.top > viewportHeight) return;
-            
-            const tag = el.tagName.toLowerCase();
-            const text = (el.innerText || el.value || el.placeholder || '').trim().slice(0, 60);
-            const id = el.id;
-            const classes = Array.from(el.classList).slice(0, 2).join('.');
-            
-            // Build selector
-            let selector = tag;
-            if (id) selector = `#${id}`;
-            else if (classes) selector += `.${classes}`;
-            
-            interactive.push({
-                selector: selector,
-                tag: tag,
-                text: text,
-                type: el.type,
-                aria: el.getAttribute('aria-label'),
-                id: id,
-                classes: classes
-            });
-        });
-        
-        return interactive;
-    }""")
+    elements = await page.evaluate(_LABEL_JS)
     formatted_elements = []
     for i, el in enumerate(elements):
         desc_parts = []
@@ -1,8 +1,13 @@
 """Utility functions for parsing LLM responses."""
 
+import re
 from typing import Union
 from ..types.llm import PlanResponse, PlanResponseError
 
+# Matches any section delimiter, capturing the section name, so one split walks the response once
+_DELIMITER_RE = re.compile(r"#/(OBSERVATION|PLAN|FUNCTION_CALLS|DONE)/#")
+# Bound once so each parse on the planner loop calls the compiled split directly
+_split_sections = _DELIMITER_RE.split
 
 def parse_delimited_response(response: str | None) -> Union[PlanResponse, PlanResponseError]:
     """
@@ -33,60 +38,21 @@ def parse_delimited_response(response: str | None) -> Union[PlanResponse, PlanRe
         return PlanResponseError(error="Response is None")
 
     try:
-        # Define the delimiters
-        obs_delimiter = "#/OBSERVATION/#"
-        plan_delimiter = "#/PLAN/#"
-        func_delimiter = "#/FUNCTION_CALLS/#"
-        done_delimiter = "#/DONE/#"
+        # Split into [preamble, name, text, name, text, ...]; each section runs to the next delimiter
+        parts = _split_sections(response)
+        sections: dict[str, str] = {}
+        for name, text in zip(parts[1::2], parts[2::2]):
+            # Keep the first occurrence of a section if the model repeats a delimiter
+            sections.setdefault(name, text)
 
-        # Initialize values
-        observation = ""
-        plan = ""
-        function_calls = []
-        done = False
-
-        # Find delimiter positions
-        obs_pos = response.find(obs_delimiter)
-        plan_pos = response.find(plan_delimiter)
-        func_pos = response.find(func_delimiter)
-        done_pos = response.find(done_delimiter)
-
-        # Extract observation
-        if obs_pos != -1 and plan_pos != -1:
-            observation = response[obs_pos + len(obs_delimiter):plan_pos].strip()
-        elif obs_pos != -1:
-            # If there's no plan delimiter, extract until the next delimiter
-            next_delim = min([p for p in [plan_pos, func_pos, done_pos] if p > obs_pos], default=len(response))
-            observation = response[obs_pos + len(obs_delimiter):next_delim].strip()
-
-        # Extract plan
-        if plan_pos != -1 and func_pos != -1:
-            plan = response[plan_pos + len(plan_delimiter):func_pos].strip()
-        elif plan_pos != -1:
-            # If there's no function delimiter, extract until the next delimiter
-            next_delim = min([p for p in [func_pos, done_pos] if p > plan_pos], default=len(response))
-            plan = response[plan_pos + len(plan_delimiter):next_delim].strip()
-
-        # Extract function calls
-        if func_pos != -1 and done_pos != -1:
-            func_text = response[func_pos + len(func_delimiter):done_pos].strip()
-            # Split by newlines and filter out empty lines
-            function_calls = [line.strip() for line in func_text.split('\n') if line.strip()]
-        elif func_pos != -1:
-            func_text = response[func_pos + len(func_delimiter):].strip()
-            function_calls = [line.strip() for line in func_text.split('\n') if line.strip()]
-
-        # Extract done status
-        if done_pos != -1:
-            done_text = response[done_pos + len(done_delimiter):].strip().lower()
-            # Check if the text contains 'true' (case insensitive)
-            done = 'true' in done_text
+        function_calls = [line.strip() for line in sections.get("FUNCTION_CALLS", "").split('\n') if line.strip()]
 
         return PlanResponse(
-            observation=observation,
-            plan=plan,
+            observation=sections.get("OBSERVATION", "").strip(),
+            plan=sections.get("PLAN", "").strip(),
             function_calls=function_calls,
-            done=done
+            # Done if the DONE section contains 'true' (case insensitive)
+            done='true' in sections.get("DONE", "").lower()
         )
 
     except Exception as e:
@@ -0,0 +1,35 @@
+"""
+Factories for Playwright mocks used by the unit tests.
+
+The Playwright API surface is introspected once at import, so building a mock only
+pays for the mock itself and not for walking Locator/Page again per test.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from playwright.async_api import Locator, Page
+
+_LOCATOR_SPEC = [name for name in dir(Locator) if not name.startswith("_")]
+_PAGE_SPEC = [name for name in dir(Page) if not name.startswith("_")]
+
+
+def make_element(visible: bool = True) -> MagicMock:
+    """Create a mock element whose is_visible() resolves to `visible`."""
+    element = MagicMock(spec=_LOCATOR_SPEC)
+    element.is_visible = AsyncMock(return_value=visible)
+    return element
+
+
+def make_locator(elements: list[MagicMock]) -> MagicMock:
+    """Create a mock locator whose all() resolves to `elements`."""
+    locator = MagicMock(spec=_LOCATOR_SPEC)
+    locator.all = AsyncMock(return_value=elements)
+    return locator
+
+
+def make_page(locator: MagicMock) -> MagicMock:
+    """Create a mock page whose css, label and text queries return `locator`."""
+    page = MagicMock(spec=_PAGE_SPEC)
+    page.locator.return_value = locator
+    page.get_by_label.return_value = locator
+    page.get_by_text.return_value = locator
+    return page
@@ -0,0 +1,59 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import asyncio
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock
+from tests._mock_factory import make_element, make_locator, make_page
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop, falling back to the default loop where it is unavailable."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser_manager_fixture():
+    """Launch the shared browser once for the whole session and shut it down at the end.
+
+    Under pytest-xdist every worker is its own process with its own session, so each
+    worker launches and owns a separate browser.
+    """
+    # Imported here so unit tests never build the app's instances
+    from agent_backend.instances import browser_manager
+
+    await browser_manager.initialize()
+    yield browser_manager
+    await browser_manager.terminate()
+
+
+@pytest.fixture
+def mock_elements(request) -> list[MagicMock]:
+    """
+    Fixture providing mock elements returned by a locator's all().
+
+    Each element's is_visible() resolves to the matching entry of the indirect
+    parameter, e.g. (True, False) gives one visible and one hidden element.
+    Defaults to a single visible element.
+    """
+    visibility = getattr(request, "param", (True,))
+    return [make_element(visible) for visible in visibility]
+
+
+@pytest.fixture
+def mock_locator(mock_elements) -> MagicMock:
+    """Fixture providing a mock locator whose all() resolves to mock_elements."""
+    return make_locator(mock_elements)
+
+
+@pytest.fixture
+def mock_page(mock_locator) -> MagicMock:
+    """Fixture providing a mock page whose css, label and text queries return mock_locator."""
+    return make_page(mock_locator)
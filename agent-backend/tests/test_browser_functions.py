@@ -0,0 +1,151 @@
+"""
+Unit tests for the browser_functions module.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from agent_backend.classes.BrowserManager import BrowserManager
+from agent_backend.utils import browser_functions
+from agent_backend.utils.browser_functions import (
+    create_browser_context,
+    create_new_locators_for_page,
+    get_locator_by_id,
+    managed_context,
+    reset_browser_context,
+)
+
+
+@pytest.fixture
+def browser_manager(monkeypatch) -> BrowserManager:
+    """Fixture installing a fresh BrowserManager as the module's manager."""
+    manager = BrowserManager()
+    monkeypatch.setattr(browser_functions, "_browser_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def mock_context(browser_manager) -> MagicMock:
+    """Fixture giving the manager a mock browser whose new_context() resolves to the returned context."""
+    context = MagicMock()
+    context.add_init_script = AsyncMock()
+    context.close = AsyncMock()
+    browser_manager._browser = MagicMock()
+    browser_manager._browser.new_context = AsyncMock(return_value=context)
+    return context
+
+
+class TestCreateBrowserContext:
+    """Tests for create_browser_context function."""
+
+    async def test_storage_state_forwarded(self, browser_manager, mock_context):
+        """Test that a saved storage state seeds the new context."""
+        # Arrange
+        storage_state = {"cookies": [], "origins": []}
+
+        # Act
+        context_id, result = await create_browser_context(storage_state=storage_state)
+
+        # Assert
+        assert result is mock_context
+        assert browser_manager.contexts[context_id] is mock_context
+        browser_manager._browser.new_context.assert_awaited_once_with(storage_state=storage_state)
+
+
+class TestCreateNewLocatorsForPage:
+    """Tests for create_new_locators_for_page function."""
+
+    async def test_locators_stored_in_one_batch(self, browser_manager):
+        """Test that all locators are stored together, keeping their order."""
+        # Arrange
+        page_id = uuid4()
+        locators = [MagicMock(), MagicMock(), MagicMock()]
+
+        # Act
+        locator_ids = await create_new_locators_for_page(page_id, locators)
+
+        # Assert
+        assert len(set(locator_ids)) == 3
+        assert [browser_manager.locators[page_id][uid] for uid in locator_ids] == locators
+
+
+class TestGetLocatorById:
+    """Tests for get_locator_by_id function."""
+
+    def test_stored_locator_returned_without_resolving(self, browser_manager):
+        """Test that a stored locator is returned without a round trip to the page."""
+        # Arrange
+        page_id = uuid4()
+        locator = MagicMock()
+        [locator_id] = browser_manager.store_locators(page_id, [locator])
+
+        # Act
+        result = get_locator_by_id(page_id, locator_id)
+
+        # Assert
+        assert result is locator
+        locator.element_handle.assert_not_called()
+
+    def test_unknown_locator(self, browser_manager):
+        """Test that an unknown locator ID raises KeyError."""
+        with pytest.raises(KeyError):
+            get_locator_by_id(uuid4(), uuid4())
+
+
+class TestManagedContext:
+    """Tests for managed_context function."""
+
+    async def test_context_deleted_when_block_raises(self, browser_manager, mock_context):
+        """Test that the context is closed and forgotten even if the block raises."""
+        # Act
+        with pytest.raises(RuntimeError):
+            async with managed_context() as (context_id, result):
+                assert browser_manager.contexts[context_id] is result
+                raise RuntimeError("boom")
+
+        # Assert
+        mock_context.close.assert_awaited_once()
+        assert context_id not in browser_manager.contexts
+
+    async def test_page_locators_dropped_with_context(self, browser_manager, mock_context):
+        """Test that deleting the context forgets its pages' locators."""
+        # Arrange
+        page_id = uuid4()
+
+        # Act
+        async with managed_context() as (context_id, _):
+            browser_manager.pages[context_id] = {page_id: MagicMock()}
+            browser_manager.store_locators(page_id, [MagicMock()])
+
+        # Assert
+        assert context_id not in browser_manager.pages
+        assert page_id not in browser_manager.locators
+
+
+class TestResetBrowserContext:
+    """Tests for reset_browser_context function."""
+
+    async def test_pages_closed_and_cookies_cleared(self, browser_manager):
+        """Test that resetting closes the context's pages and forgets them, but keeps the context."""
+        # Arrange
+        context_id = uuid4()
+        page_id = uuid4()
+        page = MagicMock()
+        page.close = AsyncMock()
+        context = MagicMock()
+        context.pages = [page]
+        context.clear_cookies = AsyncMock()
+        browser_manager.contexts[context_id] = context
+        browser_manager.pages[context_id] = {page_id: page}
+        browser_manager.locators[page_id] = {uuid4(): MagicMock()}
+
+        # Act
+        await reset_browser_context(context_id)
+
+        # Assert
+        page.close.assert_awaited_once()
+        context.clear_cookies.assert_awaited_once()
+        context.close.assert_not_called()
+        assert browser_manager.contexts[context_id] is context
+        assert context_id not in browser_manager.pages
+        assert page_id not in browser_manager.locators
@@ -5,7 +5,7 @@ Tests the parsing and execution of function calls.
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 from agent_backend.classes.Executor import Executor
 from agent_backend.types.llm import ParsedFunction
@@ -199,7 +199,6 @@ class TestExecutorExecuteFunction:
         """Create an Executor instance for testing."""
         return Executor(env_key="test-key")
 
-    @pytest.mark.asyncio
     async def test_execute_function_success(self, executor):
         """Test executing a function that succeeds."""
         # Arrange
@@ -222,7 +221,6 @@ class TestExecutorExecuteFunction:
         assert result.content == "Function executed successfully"
         mock_function.assert_called_once_with(arg1="value1", arg2="value2", context_id=context_id)
 
-    @pytest.mark.asyncio
     async def test_execute_function_failure(self, executor):
         """Test executing a function that fails."""
         # Arrange
@@ -245,7 +243,6 @@ class TestExecutorExecuteFunction:
         assert "ERROR" in result.content
         mock_function.assert_called_once_with(arg1="value1", context_id=context_id)
 
-    @pytest.mark.asyncio
     async def test_execute_function_no_args(self, executor):
         """Test executing a function with no arguments."""
         # Arrange
@@ -267,6 +264,28 @@ class TestExecutorExecuteFunction:
         assert result.success is True
         mock_function.assert_called_once_with(context_id=context_id)
 
+    async def test_execute_function_sync_function(self, executor):
+        """Test executing a synchronous function is called directly without awaiting."""
+        # Arrange
+        context_id = uuid4()
+        mock_function = MagicMock(return_value=ToolResponse(
+            success=True,
+            content="Sync function"
+        ))
+        parsed_function = ParsedFunction(
+            function=mock_function,
+            arguments={"arg1": "value1"}
+        )
+
+        # Act
+        result = await executor._execute_function(parsed_function, context_id=context_id)
+
+        # Assert
+        assert isinstance(result, ToolResponse)
+        assert result.success is True
+        assert result.content == "Sync function"
+        mock_function.assert_called_once_with(arg1="value1", context_id=context_id)
+
 
 class TestExecutorExecuteRequest:
     """Tests for Executor.execute_request method."""
@@ -276,7 +295,6 @@ class TestExecutorExecuteRequest:
         """Create an Executor instance for testing."""
         return Executor(env_key="test-key")
 
-    @pytest.mark.asyncio
     @patch('agent_backend.classes.Executor.Executor._parse_functions')
     @patch('agent_backend.classes.Executor.Executor._execute_function')
     async def test_execute_request_single_success(
@@ -305,7 +323,6 @@ class TestExecutorExecuteRequest:
         mock_parse_functions.assert_called_once()
         mock_execute_function.assert_called_once()
 
-    @pytest.mark.asyncio
     @patch('agent_backend.classes.Executor.Executor._parse_functions')
     @patch('agent_backend.classes.Executor.Executor._execute_function')
     async def test_execute_request_multiple_success(
@@ -343,7 +360,6 @@ class TestExecutorExecuteRequest:
         assert result[1].content == "Second success"
         assert mock_execute_function.call_count == 2
 
-    @pytest.mark.asyncio
     @patch('agent_backend.classes.Executor.Executor._parse_functions')
     @patch('agent_backend.classes.Executor.Executor._execute_function')
     async def test_execute_request_stops_on_failure(
@@ -385,7 +401,6 @@ class TestExecutorExecuteRequest:
         # Should only call execute_function twice (stops after failure)
         assert mock_execute_function.call_count == 2
 
-    @pytest.mark.asyncio
     @patch('agent_backend.classes.Executor.Executor._parse_functions')
     async def test_execute_request_empty_list(
         self, mock_parse_functions, executor
@@ -402,7 +417,6 @@ class TestExecutorExecuteRequest:
         assert result == []
         mock_parse_functions.assert_called_once_with([])
 
-    @pytest.mark.asyncio
     @patch('agent_backend.classes.Executor.Executor._parse_functions')
     async def test_execute_request_parse_error_propagates(
         self, mock_parse_functions, executor
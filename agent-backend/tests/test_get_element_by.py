@@ -1,18 +1,25 @@
 """
-Unit tests for the get_visible_elements_by function.
+Unit tests for the get_locator_uuids_by function.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4, UUID
-from agent_backend.tools.playwright_functions import get_visible_elements_by, get_visible_elements_by_tool
-from agent_backend.types.tool import ToolResponse
+from tests._mock_factory import make_locator
+from agent_backend.tools.playwright_functions import (
+    PLAYWRIGHT_FUNCTION_NAMES,
+    _VISIBLE_INDICES_JS,
+    get_locator_uuids_by,
+    get_locator_uuids_by_many,
+    get_locator_uuids_by_tool,
+    playwright_function_names_to_functions,
+    playwright_function_names_to_tools,
+)
 
 
-class TestGetVisibleElementsBy:
-    """Tests for get_visible_elements_by function."""
+class TestGetLocatorUuidsBy:
+    """Tests for get_locator_uuids_by function."""
 
-    @pytest.mark.asyncio
     async def test_invalid_query_by_value(self):
         """Test that invalid query_by values return an error."""
         # Arrange
@@ -22,235 +29,242 @@ class TestGetVisibleElementsBy:
         invalid_query_by = "invalid"
 
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, invalid_query_by)
+        result = await get_locator_uuids_by(context_id, page_id, query, invalid_query_by)
 
         # Assert
-        assert isinstance(result, ToolResponse)
         assert result.success is False
         assert "Invalid query_by value" in result.content
         assert "invalid" in result.content
 
-    @pytest.mark.asyncio
+    @patch('agent_backend.tools.playwright_functions.get_page_by_id')
+    async def test_invalid_query_by_does_not_fetch_page(self, mock_get_page):
+        """Test that an invalid query_by is rejected before the page is looked up."""
+        # Act
+        result = await get_locator_uuids_by(uuid4(), uuid4(), "#button", "invalid")
+
+        # Assert
+        assert result.success is False
+        mock_get_page.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "query_by, method, query, mock_elements",
+        [
+            ("css", "locator", "#login-button", (True,)),
+            ("label", "get_by_label", "Username", (True,)),
+            ("text", "get_by_text", "Login", (True, True)),
+        ],
+        indirect=["mock_elements"],
+    )
     @patch('agent_backend.tools.playwright_functions.create_new_locators_for_page')
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
-    async def test_css_query_success(self, mock_get_page, mock_create_locators):
-        """Test querying by CSS selector successfully."""
+    async def test_query_success(self, mock_get_page, mock_create_locators, mock_page, mock_elements, query_by, method, query):
+        """Test querying by CSS selector, label and text successfully."""
         # Arrange
         context_id = uuid4()
         page_id = uuid4()
-        query = "#login-button"
-        query_by = "css"
-
-        mock_element = MagicMock()
-        mock_element.is_visible = AsyncMock(return_value=True)
-
-        mock_locator = MagicMock()
-        mock_locator.all = AsyncMock(return_value=[mock_element])
-
-        mock_page = MagicMock()
-        mock_page.locator.return_value = mock_locator
         mock_get_page.return_value = mock_page
 
-        test_locator_ids = [uuid4()]
+        test_locator_ids = [uuid4() for _ in mock_elements]
         mock_create_locators.return_value = test_locator_ids
 
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, query_by)
+        result = await get_locator_uuids_by(context_id, page_id, query, query_by)
 
         # Assert
-        assert isinstance(result, ToolResponse)
         assert result.success is True
-        assert "Found 1 element(s)" in result.content
-        assert f"Locator IDs: {test_locator_ids}" in result.content
-        mock_page.locator.assert_called_once_with(query)
-        mock_create_locators.assert_called_once_with(page_id, [mock_element])
+        assert f"Found {len(mock_elements)} element(s)" in result.content
+        for locator_id in test_locator_ids:
+            assert locator_id.hex in result.content
+        getattr(mock_page, method).assert_called_once_with(query)
+        mock_create_locators.assert_called_once_with(page_id, mock_elements)
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mock_elements", [()], indirect=True)
     @patch('agent_backend.tools.playwright_functions.create_new_locators_for_page')
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
-    async def test_label_query_success(self, mock_get_page, mock_create_locators):
-        """Test querying by label successfully."""
+    async def test_element_not_found(self, mock_get_page, mock_create_locators, mock_page):
+        """Test when no elements match the query."""
         # Arrange
         context_id = uuid4()
         page_id = uuid4()
-        query = "Username"
-        query_by = "label"
-
-        mock_element = MagicMock()
-        mock_element.is_visible = AsyncMock(return_value=True)
-
-        mock_locator = MagicMock()
-        mock_locator.all = AsyncMock(return_value=[mock_element])
-
-        mock_page = MagicMock()
-        mock_page.get_by_label.return_value = mock_locator
+        query = "#nonexistent"
+        query_by = "css"
         mock_get_page.return_value = mock_page
 
-        test_locator_ids = [uuid4()]
-        mock_create_locators.return_value = test_locator_ids
-
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, query_by)
+        result = await get_locator_uuids_by(context_id, page_id, query, query_by)
 
         # Assert
-        assert isinstance(result, ToolResponse)
-        assert result.success is True
-        assert "Found 1 element(s)" in result.content
-        assert f"Locator IDs: {test_locator_ids}" in result.content
-        mock_page.get_by_label.assert_called_once_with(query)
-        mock_create_locators.assert_called_once_with(page_id, [mock_element])
+        assert result.success is False
+        assert "No element found" in result.content
+        mock_create_locators.assert_not_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mock_elements", [(False,)], indirect=True)
     @patch('agent_backend.tools.playwright_functions.create_new_locators_for_page')
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
-    async def test_text_query_success(self, mock_get_page, mock_create_locators):
-        """Test querying by text successfully."""
+    async def test_element_exists_but_not_visible(self, mock_get_page, mock_create_locators, mock_page):
+        """Test when elements match but none are visible."""
         # Arrange
         context_id = uuid4()
         page_id = uuid4()
-        query = "Login"
-        query_by = "text"
-
-        mock_element1 = MagicMock()
-        mock_element1.is_visible = AsyncMock(return_value=True)
-        mock_element2 = MagicMock()
-        mock_element2.is_visible = AsyncMock(return_value=True)
-
-        mock_locator = MagicMock()
-        mock_locator.all = AsyncMock(return_value=[mock_element1, mock_element2])
-
-        mock_page = MagicMock()
-        mock_page.get_by_text.return_value = mock_locator
+        query = "#hidden-button"
+        query_by = "css"
         mock_get_page.return_value = mock_page
 
-        test_locator_ids = [uuid4(), uuid4()]
-        mock_create_locators.return_value = test_locator_ids
-
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, query_by)
+        result = await get_locator_uuids_by(context_id, page_id, query, query_by)
 
         # Assert
-        assert isinstance(result, ToolResponse)
-        assert result.success is True
-        assert "Found 2 element(s)" in result.content
-        assert f"Locator IDs: {test_locator_ids}" in result.content
-        mock_page.get_by_text.assert_called_once_with(query)
-        mock_create_locators.assert_called_once_with(page_id, [mock_element1, mock_element2])
+        assert result.success is False
+        assert "No element found" in result.content
+        mock_create_locators.assert_not_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mock_elements", [(True, False, True, False)], indirect=True)
+    @patch('agent_backend.tools.playwright_functions.create_new_locators_for_page')
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
-    async def test_element_not_found(self, mock_get_page):
-        """Test when no elements match the query."""
+    async def test_mixed_visibility_keeps_visible_in_order(self, mock_get_page, mock_create_locators, mock_page, mock_elements):
+        """Test that only visible elements are kept, in their original order."""
         # Arrange
         context_id = uuid4()
         page_id = uuid4()
-        query = "#nonexistent"
+        query = "button"
         query_by = "css"
-
-        mock_locator = MagicMock()
-        mock_locator.all = AsyncMock(return_value=[])
-
-        mock_page = MagicMock()
-        mock_page.locator.return_value = mock_locator
         mock_get_page.return_value = mock_page
+        mock_create_locators.return_value = [uuid4(), uuid4()]
 
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, query_by)
+        result = await get_locator_uuids_by(context_id, page_id, query, query_by)
 
         # Assert
-        assert isinstance(result, ToolResponse)
-        assert result.success is False
-        assert "No element found" in result.content
-
-    @pytest.mark.asyncio
+        assert result.success is True
+        assert "Found 2 element(s)" in result.content
+        for mock_element in mock_elements:
+            mock_element.is_visible.assert_awaited_once()
+        mock_create_locators.assert_called_once_with(page_id, [mock_elements[0], mock_elements[2]])
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (TimeoutError("Page timeout"), "Request timed out"),
+            (Exception("Unexpected error"), "Unexpected error"),
+        ],
+    )
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
-    async def test_element_exists_but_not_visible(self, mock_get_page):
-        """Test when elements match but none are visible."""
+    async def test_error_handling(self, mock_get_page, error, expected):
+        """Test handling of timeout and unexpected errors."""
         # Arrange
         context_id = uuid4()
         page_id = uuid4()
-        query = "#hidden-button"
+        query = "#button"
         query_by = "css"
 
-        mock_element = MagicMock()
-        mock_element.is_visible = AsyncMock(return_value=False)
+        mock_get_page.side_effect = error
 
-        mock_locator = MagicMock()
-        mock_locator.all = AsyncMock(return_value=[mock_element])
+        # Act
+        result = await get_locator_uuids_by(context_id, page_id, query, query_by)
 
-        mock_page = MagicMock()
-        mock_page.locator.return_value = mock_locator
-        mock_get_page.return_value = mock_page
+        # Assert
+        assert result.success is False
+        assert expected in result.content
+
+
+class TestGetLocatorUuidsByMany:
+    """Tests for get_locator_uuids_by_many function."""
 
+    @patch('agent_backend.tools.playwright_functions.get_page_by_id')
+    async def test_no_selectors(self, mock_get_page):
+        """Test that an empty selector list is rejected before the page is looked up."""
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, query_by)
+        result = await get_locator_uuids_by_many(uuid4(), uuid4(), " ; ")
 
         # Assert
-        assert isinstance(result, ToolResponse)
         assert result.success is False
-        assert "No element found" in result.content
+        assert "No selectors provided" in result.content
+        mock_get_page.assert_not_called()
 
-    @pytest.mark.asyncio
+    @patch('agent_backend.tools.playwright_functions.create_new_locators_for_page')
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
-    async def test_timeout_error(self, mock_get_page):
-        """Test handling of timeout errors."""
+    async def test_selectors_resolved_with_playwright_locators(self, mock_get_page, mock_create_locators, mock_page):
+        """Test that each selector is matched through page.locator() and all matches are stored in one batch."""
         # Arrange
         context_id = uuid4()
         page_id = uuid4()
-        query = "#button"
-        query_by = "css"
+        button_locator, search_locator = make_locator([]), make_locator([])
+        button_locator.evaluate_all = AsyncMock(return_value=[0, 2])
+        search_locator.evaluate_all = AsyncMock(return_value=[1])
+        mock_page.locator.side_effect = [button_locator, search_locator]
+        mock_get_page.return_value = mock_page
+        test_locator_ids = [uuid4(), uuid4(), uuid4()]
+        mock_create_locators.return_value = test_locator_ids
+
+        # Act
+        result = await get_locator_uuids_by_many(context_id, page_id, "button; #search")
 
-        mock_get_page.side_effect = TimeoutError("Page timeout")
+        # Assert
+        assert result.success is True
+        assert [c.args for c in mock_page.locator.call_args_list] == [("button",), ("#search",)]
+        button_locator.evaluate_all.assert_awaited_once_with(_VISIBLE_INDICES_JS)
+        search_locator.evaluate_all.assert_awaited_once_with(_VISIBLE_INDICES_JS)
+        mock_create_locators.assert_called_once_with(
+            page_id, [button_locator.nth.return_value, button_locator.nth.return_value, search_locator.nth.return_value]
+        )
+        assert [c.args for c in button_locator.nth.call_args_list] == [(0,), (2,)]
+        search_locator.nth.assert_called_once_with(1)
+        button_line, search_line = result.content.split("\n")
+        assert "css='button'" in button_line
+        assert test_locator_ids[0].hex in button_line and test_locator_ids[1].hex in button_line
+        assert "css='#search'" in search_line
+        assert test_locator_ids[2].hex in search_line
+
+    @patch('agent_backend.tools.playwright_functions.create_new_locators_for_page')
+    @patch('agent_backend.tools.playwright_functions.get_page_by_id')
+    async def test_missing_and_invalid_selectors_reported(self, mock_get_page, mock_create_locators, mock_page):
+        """Test that selectors without matches or that fail to resolve are reported, not stored."""
+        # Arrange
+        hidden_locator, bad_locator = make_locator([]), make_locator([])
+        hidden_locator.evaluate_all = AsyncMock(return_value=[])
+        bad_locator.evaluate_all = AsyncMock(side_effect=Exception("Unexpected token"))
+        mock_page.locator.side_effect = [hidden_locator, bad_locator]
+        mock_get_page.return_value = mock_page
 
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, query_by)
+        result = await get_locator_uuids_by_many(uuid4(), uuid4(), "#hidden;[[bad")
 
         # Assert
-        assert isinstance(result, ToolResponse)
         assert result.success is False
-        assert "Request timed out" in result.content
+        assert "No element found with css='#hidden'" in result.content
+        assert "Could not resolve css='[[bad': Unexpected token" in result.content
+        mock_create_locators.assert_not_called()
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_unexpected_error(self, mock_get_page):
         """Test handling of unexpected errors."""
         # Arrange
-        context_id = uuid4()
-        page_id = uuid4()
-        query = "#button"
-        query_by = "css"
-
         mock_get_page.side_effect = Exception("Unexpected error")
 
         # Act
-        result = await get_visible_elements_by(context_id, page_id, query, query_by)
+        result = await get_locator_uuids_by_many(uuid4(), uuid4(), "#button")
 
         # Assert
-        assert isinstance(result, ToolResponse)
         assert result.success is False
         assert "Unexpected error" in result.content
 
 
-class TestGetVisibleElementsByTool:
-    """Tests for get_visible_elements_by_tool definition."""
+class TestGetLocatorUuidsByTool:
+    """Tests for get_locator_uuids_by_tool definition."""
 
     def test_tool_definition(self):
         """Test that the tool is properly defined."""
-        assert get_visible_elements_by_tool.name == "get_visible_elements_by"
-        assert get_visible_elements_by_tool.type == "function"
-        assert "page_id" in get_visible_elements_by_tool.parameters.properties
-        assert "query" in get_visible_elements_by_tool.parameters.properties
-        assert "query_by" in get_visible_elements_by_tool.parameters.properties
-        assert get_visible_elements_by_tool.parameters.required == ["page_id", "query", "query_by"]
+        assert get_locator_uuids_by_tool.name == "get_locator_uuids_by"
+        assert get_locator_uuids_by_tool.type == "function"
+        assert "page_id" in get_locator_uuids_by_tool.parameters.properties
+        assert "query" in get_locator_uuids_by_tool.parameters.properties
+        assert "query_by" in get_locator_uuids_by_tool.parameters.properties
+        assert get_locator_uuids_by_tool.parameters.required == ["page_id", "query", "query_by"]
 
     def test_tool_registered_in_dictionaries(self):
         """Test that the tool is registered in the function mappings."""
-        from agent_backend.tools.playwright_functions import (
-            playwright_function_names_to_functions,
-            playwright_function_names_to_tools
-        )
-
-        assert "get_visible_elements_by" in playwright_function_names_to_functions
-        assert "get_visible_elements_by" in playwright_function_names_to_tools
-        assert playwright_function_names_to_functions["get_visible_elements_by"] == get_visible_elements_by
-        assert playwright_function_names_to_tools["get_visible_elements_by"] == get_visible_elements_by_tool
+        assert "get_locator_uuids_by" in PLAYWRIGHT_FUNCTION_NAMES
+        assert "get_locator_uuids_by" in playwright_function_names_to_functions
+        assert "get_locator_uuids_by" in playwright_function_names_to_tools
+        assert playwright_function_names_to_functions["get_locator_uuids_by"] == get_locator_uuids_by
+        assert playwright_function_names_to_tools["get_locator_uuids_by"] == get_locator_uuids_by_tool
@@ -1,140 +1,327 @@
 """
 Integration tests for browser automation using Playwright.
 
-Run with: poetry run pytest tests/test_integration_playwright.py -v -s
+Run with: poetry run pytest tests/test_integration_playwright.py -v --log-cli-level=INFO
+Run in parallel with: poetry run pytest tests/test_integration_playwright.py -n 4
+
+Tests are parallelized across xdist worker processes rather than interleaved on one loop:
+pytest-asyncio owns every coroutine test here (auto mode) and the shared browser lives on
+its session loop, neither of which pytest-asyncio-cooperative supports.
+
+Every worker is its own process, so each one launches its own browser and sets up the
+context pool and shared_pages again. With only a handful of tests per worker that setup
+is not amortized, so workers skip the pool warm-up. No speedup from -n has been measured
+for this module on its own.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-import re
+import logging
+import os
 from pathlib import Path
 from uuid import UUID
 
-from agent_backend.instances import browser_manager
+pytest.importorskip("playwright.async_api")
+from playwright.sync_api import sync_playwright
+
+
+def _chromium_installed() -> bool:
+    """Check for the Chromium build Playwright launches, without starting it."""
+    with sync_playwright() as playwright:
+        return Path(playwright.chromium.executable_path).exists()
+
+
+if not _chromium_installed():
+    pytest.skip("Playwright Chromium is not installed (run `playwright install chromium`)", allow_module_level=True)
+
 from agent_backend.utils.browser_functions import (
+    _LABEL_JS,
     create_browser_context,
+    create_new_locators_for_page,
+    create_page,
     delete_browser_context_by_id,
     delete_page_by_page_id,
-    get_page_by_id
+    get_browser_context_by_id,
+    get_labeled_elements,
+    get_page_by_id,
+    managed_context,
+    reset_browser_context
 )
 from agent_backend.tools.playwright_functions import (
-    go_to_url,
-    type_text,
-    extract_text,
-    wait_for_selector,
+    WaitUntil,
+    open_page,
+    click_by_locator,
+    extract_text_by_locator,
     screenshot_page,
     scroll
 )
 
-# Mark all tests as integration tests
-pytestmark = pytest.mark.integration
+logger = logging.getLogger(__name__)
+
+# Mark all tests as integration tests, run on the session loop the shared browser lives on
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
 
 # Screenshots directory
 SCREENSHOTS_DIR = Path(__file__).parent.parent / "screenshots"
 SCREENSHOTS_DIR.mkdir(exist_ok=True)
-
-
-def extract_page_id_from_response(response_content: str) -> UUID:
-    """Extract page_id UUID from go_to_url response content."""
-    match = re.search(r'Page ID: ([0-9a-f-]+)', response_content)
-    if match:
-        return UUID(match.group(1))
-    raise ValueError(f"Could not extract page_id from: {response_content}")
+# Screenshots are only checked for existence, so JPEG keeps encoding and disk writes cheap
+SCREENSHOT_QUALITY = 70
+SCROLLED_SHOT = os.fspath(SCREENSHOTS_DIR / "03_scrolled.jpg")
+PAGE1_SHOT = os.fspath(SCREENSHOTS_DIR / "04_page1.jpg")
+PAGE2_SHOT = os.fspath(SCREENSHOTS_DIR / "05_page2.jpg")
+
+
+async def screenshot_size(path: str) -> int:
+    """Return the size of a written screenshot, stat-ing it off the event loop."""
+    return await asyncio.to_thread(os.path.getsize, path)
+
+
+async def navigate(context_id: UUID, url: str, wait_until: WaitUntil = "domcontentloaded") -> UUID:
+    """Navigate a new page in the context to url and return its page_id."""
+    page_id, response = await open_page(context_id, url, wait_until=wait_until)
+    assert response.success, f"Navigation failed: {response.content}"
+    logger.info("✅ %s", response.content)
+    return page_id
+
+
+# Number of browser contexts created up front and leased to tests. At most two are ever
+# leased at once: shared_context for the module and test_context for a state-changing test.
+# Raise this only when adding a lease, since every pooled context is also warmed up.
+CONTEXT_POOL_SIZE = 2
+# Host the tests navigate to, visited once per pooled context before any test runs
+WARMUP_URL = "https://github.com"
+# Workers each run only a slice of the tests, too few to pay back a warm-up per worker
+WARM_UP_POOL = "PYTEST_XDIST_WORKER" not in os.environ
+# Fail fast on missing elements; navigations over the network get a little longer
+DEFAULT_TIMEOUT_MS = 5000
+NAVIGATION_TIMEOUT_MS = 10000
+
+
+async def warm_up_context(context_id: UUID) -> None:
+    """Visit WARMUP_URL on a throwaway page so later navigations reuse its connection and DNS entry."""
+    page = await get_browser_context_by_id(context_id).new_page()
+    try:
+        await page.goto(WARMUP_URL, wait_until="commit")
+    finally:
+        await page.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def context_pool(browser_manager_fixture):
+    """Create a pool of browser contexts once per session, handed out through a queue.
+
+    The contexts are warmed up first unless running in an xdist worker.
+    """
+    pool: asyncio.Queue[UUID] = asyncio.Queue()
+    context_ids = [context_id for context_id, _ in await asyncio.gather(
+        *(create_browser_context() for _ in range(CONTEXT_POOL_SIZE))
+    )]
+    for context_id in context_ids:
+        context = get_browser_context_by_id(context_id)
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    if WARM_UP_POOL:
+        await asyncio.gather(*(warm_up_context(context_id) for context_id in context_ids))
+    for context_id in context_ids:
+        pool.put_nowait(context_id)
+    yield pool
+    await asyncio.gather(*(delete_browser_context_by_id(context_id) for context_id in context_ids))
+
+
+async def release_context(context_pool: asyncio.Queue, context_id: UUID) -> None:
+    """Reset the context and return it to the pool."""
+    await reset_browser_context(context_id)
+    context_pool.put_nowait(context_id)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def test_context(context_pool):
+    """Lease a context from the pool for a single test."""
+    context_id = await context_pool.get()
+    try:
+        yield context_id
+    finally:
+        await release_context(context_pool, context_id)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def shared_context(context_pool):
+    """Lease one context for the whole module, for tests that only read pages.
+
+    Tests using it open and close their own pages and must not sign in or otherwise
+    change the context's cookies or storage.
+    """
+    context_id = await context_pool.get()
+    try:
+        yield context_id
+    finally:
+        await release_context(context_pool, context_id)
+
+
+# Pages the read-only tests work on, opened together once per module, with the navigation
+# event each needs. test_scroll and the screenshots need /explore fully rendered; the rest
+# only read the DOM.
+SHARED_URLS: dict[str, tuple[str, WaitUntil]] = {
+    "github": ("https://github.com", "domcontentloaded"),
+    "explore": ("https://github.com/explore", "load"),
+}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def shared_pages(shared_context):
+    """Open every page in SHARED_URLS concurrently and yield a name to page_id mapping.
+
+    Tests sharing these pages must leave them on their URLs.
+    """
+    page_ids = await asyncio.gather(
+        *(navigate(shared_context, url, wait_until) for url, wait_until in SHARED_URLS.values())
+    )
+    try:
+        yield dict(zip(SHARED_URLS, page_ids))
+    finally:
+        await asyncio.gather(*(delete_page_by_page_id(shared_context, page_id) for page_id in page_ids))
 
 
 class TestGitHubNavigation:
     """Integration tests for GitHub navigation."""
 
-    @pytest.mark.asyncio
-    async def test_browser_initialization(self):
+    async def test_browser_initialization(self, browser_manager_fixture):
         """Test that the browser manager initializes correctly."""
-        await browser_manager.initialize()
-        
-        assert browser_manager.browser is not None
-        print("✅ Browser initialized")
-        
-        await browser_manager.terminate()
-
-    @pytest.mark.asyncio
-    async def test_create_context_and_navigate(self):
-        """Test creating a context and navigating to a page."""
-        await browser_manager.initialize()
+        assert browser_manager_fixture.browser is not None
+        logger.info("✅ Browser initialized")
 
-        try:
-            # Create context
-            context_id, _ = await create_browser_context()
-            print(f"✅ Context created: {context_id}")
+    async def test_create_context_and_navigate(self, browser_manager_fixture):
+        """Test creating a context and navigating to a page."""
+        # The context and its pages are deleted when the block exits, even if an assertion fails
+        async with managed_context() as (context_id, _):
+            logger.info("✅ Context created: %s", context_id)
 
             # Navigate to GitHub
-            response = await go_to_url(context_id, "https://github.com")
+            # Only the URL is checked, so there is no need to wait for subresources
+            page_id, response = await open_page(context_id, "https://github.com", wait_until="domcontentloaded")
             assert response.success, f"Navigation failed: {response.content}"
-            print(f"✅ {response.content}")
-
-            # Verify we're on GitHub (need to get page to check URL)
-            # Note: In real usage, you'd track page_id from response.content or use a different approach
+            logger.info("✅ %s", response.content)
 
-            # Cleanup
-            await delete_browser_context_by_id(context_id)
-            print("✅ Cleanup complete")
-
-        finally:
-            await browser_manager.terminate()
+            # Verify we're on GitHub
+            assert "github.com" in get_page_by_id(context_id, page_id).url
+        logger.info("✅ Cleanup complete")
 
-    @pytest.mark.asyncio
-    async def test_extract_text(self):
+    async def test_extract_text(self, shared_context, shared_pages):
         """Test extracting text from a page."""
-        await browser_manager.initialize()
+        context_id, page_id = shared_context, shared_pages["github"]
 
-        try:
-            context_id, _ = await create_browser_context()
+        # Extract heading text. text_content() waits for the element itself, so no separate wait is needed
+        heading = get_page_by_id(context_id, page_id).locator("h1, h2").first
+        [locator_id] = await create_new_locators_for_page(page_id, [heading])
+        response = await extract_text_by_locator(context_id, page_id, locator_id)
+        assert response.success, f"Extract failed: {response.content}"
 
-            response = await go_to_url(context_id, "https://github.com")
-            assert response.success, f"Navigation failed: {response.content}"
-            page_id = extract_page_id_from_response(response.content)
+        logger.info("✅ Extracted text: '%s'", response.content)
+        assert len(response.content) > 0
 
-            # Extract heading text
-            response = await wait_for_selector(context_id, page_id, "h1, h2", timeout=5000)
-            assert response.success, f"Wait failed: {response.content}"
+    async def test_scroll(self, shared_context, shared_pages):
+        """Test scrolling on a page."""
+        context_id, page_id = shared_context, shared_pages["explore"]
+
+        # Scroll down
+        response = await scroll(context_id, page_id, 0, 500)
+        assert response.success, f"Scroll failed: {response.content}"
+        logger.info("✅ %s", response.content)
+
+        # Screenshot after scroll. window.scrollTo has finished once evaluate returns, so no wait is needed
+        response = await screenshot_page(context_id, page_id, SCROLLED_SHOT, quality=SCREENSHOT_QUALITY)
+        assert response.success, f"Screenshot failed: {response.content}"
+        logger.info("✅ %s", response.content)
+        assert await screenshot_size(SCROLLED_SHOT) > 0
+
+    async def test_multiple_pages_in_context(self, shared_context, shared_pages):
+        """Test capturing two pages open in the same context concurrently."""
+        context_id = shared_context
+        page1_id, page2_id = shared_pages["github"], shared_pages["explore"]
+        assert page1_id != page2_id
+
+        responses = await asyncio.gather(
+            screenshot_page(context_id, page1_id, PAGE1_SHOT, quality=SCREENSHOT_QUALITY),
+            screenshot_page(context_id, page2_id, PAGE2_SHOT, quality=SCREENSHOT_QUALITY)
+        )
+        for response in responses:
+            assert response.success, f"Screenshot failed: {response.content}"
+            logger.info("✅ %s", response.content)
+        sizes = await asyncio.gather(screenshot_size(PAGE1_SHOT), screenshot_size(PAGE2_SHOT))
+        assert all(size > 0 for size in sizes)
 
-            response = await extract_text(context_id, page_id, "h1, h2")
-            assert response.success, f"Extract failed: {response.content}"
+    async def test_sign_in_navigation(self, test_context):
+        """Test that clicking Sign in lands on the login page.
 
-            print(f"✅ Extracted text: '{response.content}'")
-            assert len(response.content) > 0
+        Runs on its own leased context so the login flow cannot leak state into shared_context.
+        """
+        context_id = test_context
+        page_id = await navigate(context_id, "https://github.com")
+        page = get_page_by_id(context_id, page_id)
 
-            await delete_page_by_page_id(context_id, page_id)
-            await delete_browser_context_by_id(context_id)
+        sign_in = page.locator('a[href="/login"]').first
+        [locator_id] = await create_new_locators_for_page(page_id, [sign_in])
 
-        finally:
-            await browser_manager.terminate()
+        # Resolve as soon as /login commits, failing fast if it never does
+        async with page.expect_navigation(url="**/login*", timeout=5000):
+            response = await click_by_locator(context_id, page_id, locator_id)
+        assert response.success, f"Click failed: {response.content}"
+        logger.info("✅ %s", response.content)
 
-    @pytest.mark.asyncio
-    async def test_scroll(self):
-        """Test scrolling on a page."""
-        await browser_manager.initialize()
+        assert "/login" in page.url
 
-        try:
-            context_id, _ = await create_browser_context()
 
-            response = await go_to_url(context_id, "https://github.com/explore")
-            assert response.success, f"Navigation failed: {response.content}"
-            page_id = extract_page_id_from_response(response.content)
+class TestLabeledElements:
+    """Integration tests for scraping interactive elements."""
 
-            # Scroll down
-            response = await scroll(context_id, page_id, 0, 500)
-            assert response.success, f"Scroll failed: {response.content}"
-            print(f"✅ {response.content}")
-
-            await asyncio.sleep(1)
-
-            # Screenshot after scroll
-            screenshot_path = str(SCREENSHOTS_DIR / "03_scrolled.png")
-            response = await screenshot_page(context_id, page_id, screenshot_path)
-            assert response.success, f"Screenshot failed: {response.content}"
-            print(f"✅ {response.content}")
-
-            await delete_page_by_page_id(context_id, page_id)
-            await delete_browser_context_by_id(context_id)
+    async def test_fresh_page_elements_listed(self, shared_context):
+        """Test that elements are listed before the visibility tracker has reported on them."""
+        page_id, page = await create_page(shared_context)
+        try:
+            await page.set_content(
+                '<button>Submit</button>'
+                '<a href="#">Home</a>'
+                '<button style="width:0;height:0;padding:0;border:0">Empty</button>'
+            )
+            # Added and scraped in the same frame, so only measuring can find it
+            await page.evaluate("""() => {
+                const div = document.createElement('div');
+                div.setAttribute('role', 'button');
+                div.textContent = 'Late';
+                document.body.appendChild(div);
+            }""")
+
+            elements = await get_labeled_elements(shared_context, page_id)
+            logger.info("✅ Labeled elements:\n%s", elements)
+
+            assert 'text="Submit"' in elements
+            assert 'text="Home"' in elements
+            assert 'text="Late"' in elements
+            assert 'text="Empty"' not in elements
+        finally:
+            await delete_page_by_page_id(shared_context, page_id)
 
+    async def test_tracked_and_measured_paths_agree(self, shared_context):
+        """Test that an element is listed the same whether it is measured or reported by the tracker."""
+        page_id, page = await create_page(shared_context)
+        try:
+            await page.set_content("<main></main>")
+            # Insert and scrape in one evaluate, before the tracker can report, so the measured path runs
+            measured = await page.evaluate(f"""() => {{
+                document.querySelector('main').innerHTML =
+                    '<a href="#main" style="position:absolute;left:-9999px">Skip to content</a>'
+                    + '<button>Submit</button>';
+                return ({_LABEL_JS})();
+            }}""")
+            # Two frames later the tracker has reported on both elements
+            await page.evaluate("() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))")
+            assert await page.evaluate(
+                "() => [...document.querySelectorAll('main > *')].every(el => window.__interactiveVisibility.has(el))"
+            )
+            tracked = await page.evaluate(_LABEL_JS)
+
+            assert measured == tracked
+            assert [el["text"] for el in tracked] == ["Submit"]
         finally:
-            await browser_manager.terminate()
+            await delete_page_by_page_id(shared_context, page_id)
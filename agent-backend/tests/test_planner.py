@@ -10,14 +10,15 @@ from agent_backend.classes.Planner import Planner
 from agent_backend.types.llm import PlanResponse, PlanResponseError
 
 
+@pytest.fixture(scope="module")
+def planner():
+    """Create one Planner for the module; _parse_plan keeps no state between calls."""
+    return Planner(api_key="test-key")
+
+
 class TestPlannerParsePlan:
     """Tests for Planner._parse_plan method."""
 
-    @pytest.fixture
-    def planner(self):
-        """Create a Planner instance for testing."""
-        return Planner(api_key="test-key")
-
     def test_parse_plan_valid_json(self, planner):
         """Test parsing a valid plan JSON response."""
         # Arrange
@@ -182,3 +183,66 @@ class TestPlannerParsePlan:
         assert result.plan == "Test plan"
         assert result.function_calls == ["go_to_url(https://example.com)"]
         assert result.done is False
+
+
+class TestPlannerParseDelimitedPlan:
+    """Tests for Planner._parse_plan with the delimiter-based response format."""
+
+    def test_parse_all_sections(self, planner):
+        """Test parsing a response with every section present."""
+        # Arrange
+        response = (
+            "#/OBSERVATION/#\nThe user wants GitHub.\n\n"
+            "#/PLAN/#\nNavigate to GitHub homepage\n\n"
+            "#/FUNCTION_CALLS/#\ngo_to_url(url=https://github.com)\n\n"
+            "scroll(page_id=abc,x=0,y=500)\n"
+            "#/DONE/#\nfalse\n"
+        )
+
+        # Act
+        result = planner._parse_plan(response)
+
+        # Assert
+        assert isinstance(result, PlanResponse)
+        assert result.observation == "The user wants GitHub."
+        assert result.plan == "Navigate to GitHub homepage"
+        assert result.function_calls == ["go_to_url(url=https://github.com)", "scroll(page_id=abc,x=0,y=500)"]
+        assert result.done is False
+
+    @pytest.mark.parametrize("done_text, expected", [("true", True), ("TRUE", True), ("false", False), ("", False)])
+    def test_parse_done(self, planner, done_text, expected):
+        """Test that done is set when the DONE section contains 'true', in any case."""
+        # Act
+        result = planner._parse_plan(f"#/PLAN/#\nAll finished\n#/DONE/#\n{done_text}")
+
+        # Assert
+        assert result.done is expected
+
+    def test_parse_missing_sections(self, planner):
+        """Test that missing sections parse as empty values."""
+        # Act
+        result = planner._parse_plan("#/PLAN/#\nJust thinking")
+
+        # Assert
+        assert isinstance(result, PlanResponse)
+        assert result.observation == ""
+        assert result.plan == "Just thinking"
+        assert result.function_calls == []
+        assert result.done is False
+
+    def test_parse_function_calls_without_done(self, planner):
+        """Test that function calls run to the end of the response when DONE is missing."""
+        # Act
+        result = planner._parse_plan("#/OBSERVATION/#\nseen\n#/FUNCTION_CALLS/#\nreload_page(page_id=abc)\n")
+
+        # Assert
+        assert result.observation == "seen"
+        assert result.function_calls == ["reload_page(page_id=abc)"]
+
+    def test_parse_none(self, planner):
+        """Test that a missing response is reported as an error."""
+        # Act
+        result = planner._parse_plan(None)
+
+        # Assert
+        assert isinstance(result, PlanResponseError)
@@ -101,7 +101,6 @@ class TestGoToUrl:
     - The function returns the correct tuple format
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.create_page')
     async def test_go_to_url_success(self, mock_create_page, context_id, page_id, mock_page):
         """
@@ -133,7 +132,6 @@ class TestClick:
     Tests cover success cases, timeout errors, and unexpected errors.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_click_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -156,7 +154,6 @@ class TestClick:
         assert "Successfully clicked element" in result.content
         assert selector in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_click_timeout(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -180,7 +177,6 @@ class TestClick:
         assert "timed out" in result.content.lower()
         assert selector in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_click_unexpected_error(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -212,7 +208,6 @@ class TestTypeText:
     Tests verify success, timeout, and error scenarios.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_type_text_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -235,7 +230,6 @@ class TestTypeText:
         assert "Successfully typed text" in result.content
         assert text in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_type_text_timeout(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -267,7 +261,6 @@ class TestExtractText:
     Tests cover successful extraction, empty content, timeouts, and errors.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_extract_text_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -289,7 +282,6 @@ class TestExtractText:
         mock_page.text_content.assert_called_once_with(selector=selector, timeout=5000)
         assert result.content == "Hello World"
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_extract_text_no_content(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -312,7 +304,6 @@ class TestExtractText:
         assert "No text content found" in result.content
         assert selector in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_extract_text_timeout(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -343,7 +334,6 @@ class TestWaitForSelector:
     Tests verify default timeout, custom timeout, and timeout errors.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_wait_for_selector_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -364,7 +354,6 @@ class TestWaitForSelector:
         mock_page.wait_for_selector.assert_called_once_with(selector=selector, timeout=5000)
         assert "is now present" in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_wait_for_selector_custom_timeout(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -385,7 +374,6 @@ class TestWaitForSelector:
         assert result.success is True
         mock_page.wait_for_selector.assert_called_once_with(selector=selector, timeout=custom_timeout)
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_wait_for_selector_timeout(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -417,7 +405,6 @@ class TestEvaluateScript:
     Tests verify successful script execution and error handling.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_evaluate_script_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -439,7 +426,6 @@ class TestEvaluateScript:
         mock_page.evaluate.assert_called_once_with(expression=script, arg=None)
         assert "{'title': 'Example Page'}" in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_evaluate_script_with_arg(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -462,7 +448,6 @@ class TestEvaluateScript:
         mock_page.evaluate.assert_called_once_with(expression=script, arg=arg)
         assert "result" in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_evaluate_script_error(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -493,7 +478,6 @@ class TestScroll:
     Tests verify successful scrolling and error handling.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_scroll_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -515,7 +499,6 @@ class TestScroll:
         assert "Successfully scrolled" in result.content
         assert f"({x}, {y})" in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_scroll_error(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -545,7 +528,6 @@ class TestSetViewportSize:
     Tests verify successful viewport changes and error handling.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_set_viewport_size_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -567,7 +549,6 @@ class TestSetViewportSize:
         assert "Successfully set viewport" in result.content
         assert f"({width}, {height})" in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_set_viewport_size_error(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -597,7 +578,6 @@ class TestReloadPage:
     Tests verify successful reload and error handling.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_reload_page_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -617,7 +597,6 @@ class TestReloadPage:
         mock_page.reload.assert_called_once()
         assert "Successfully reloaded" in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_reload_page_error(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -647,7 +626,6 @@ class TestScreenshotPage:
     Tests verify successful screenshot capture and error handling.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_screenshot_page_success(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -669,7 +647,6 @@ class TestScreenshotPage:
         assert "Successfully took screenshot" in result.content
         assert path in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_page_by_id')
     async def test_screenshot_page_error(self, mock_get_page, context_id, page_id, mock_page):
         """
@@ -699,7 +676,6 @@ class TestGetOpenPages:
     Tests verify that the context's pages are returned correctly.
     """
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_browser_context_by_id')
     async def test_get_open_pages_success(self, mock_get_context, context_id, mock_browser_context):
         """
@@ -727,7 +703,6 @@ class TestGetOpenPages:
         assert "example.com/page1" in result.content
         assert "example.com/page2" in result.content
 
-    @pytest.mark.asyncio
     @patch('agent_backend.tools.playwright_functions.get_browser_context_by_id')
     async def test_get_open_pages_empty(self, mock_get_context, context_id, mock_browser_context):
         """
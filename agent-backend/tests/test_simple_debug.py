@@ -4,7 +4,6 @@ Simple debug test to verify pytest-asyncio is working.
 
 import pytest
 
-@pytest.mark.asyncio
 async def test_async_works():
     """Test that async tests run at all."""
     print("\n✅ Async test is running!")
@@ -19,7 +18,6 @@ async def simple_fixture():
     print("\n✅ Async fixture cleanup running!")
 
 
-@pytest.mark.asyncio
 async def test_with_fixture(simple_fixture):
     """Test that async fixtures are called."""
     print(f"\n✅ Test got fixture value: {simple_fixture}")